@@ -4,6 +4,7 @@ Supports environment-based configuration for local development (DynamoDB Local,
 and production deployments (DynamoDB, Zilliz, Bedrock).
 """
 
+from functools import lru_cache
 from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -63,8 +64,13 @@ class Settings(BaseSettings):
         return self.environment == "production"
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings instance.
+    """Get the cached application settings instance.
+
+    The settings are built once per process so that `.env` parsing and validation
+    are not repeated on every `Depends(get_settings)` resolution. Call
+    `get_settings.cache_clear()` to force a reload (e.g. in tests).
 
     Returns:
         Settings: Application configuration loaded from environment.
@@ -1,6 +1,12 @@
 """Domain entities package.
 
 This package contains all domain entities with zero infrastructure dependencies.
+
+Several entities keep derived lookup data (lowercased names, indices, precomputed
+scores) in underscore-prefixed dataclass fields. These are internal caches, not
+part of the entity's data, but `dataclasses.fields` and `dataclasses.asdict`
+still include them. Mappers and API schemas must serialize from an explicit list
+of public fields rather than dumping the dataclass wholesale.
 """
 
 from app.domain.entities.feedback import Feedback
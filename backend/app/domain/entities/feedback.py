@@ -3,12 +3,17 @@
 This module contains the Feedback entity for user recipe ratings.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
-from typing import Optional
+from typing import Final, Optional
 
+_VALID_RATINGS: Final[frozenset[int]] = frozenset((1, 2, 3, 4, 5))
 
-@dataclass
+# Sentiment multiplier indexed by would_make_again (False -> 0, True -> 1)
+_MAKE_AGAIN_MULTIPLIERS: Final[tuple[float, float]] = (0.8, 1.2)
+
+
+@dataclass(frozen=True, slots=True)
 class Feedback:
     """User feedback on a recipe they've cooked.
 
@@ -33,12 +38,22 @@ class Feedback:
     notes: Optional[str] = None
     cooked_date: Optional[date] = None
     created_at: Optional[date] = None
+    _sentiment: float = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Validate feedback data."""
-        if not 1 <= self.rating <= 5:
+        """Validate feedback data and precompute the sentiment score."""
+        if self.rating not in _VALID_RATINGS:
             raise ValueError(f"Rating must be between 1 and 5, got {self.rating}")
 
+        # Normalize rating to -1 to 1 range (rating 3 = neutral 0)
+        normalized_rating = (self.rating - 3) / 2
+
+        # Boost or reduce based on would_make_again
+        score = normalized_rating * _MAKE_AGAIN_MULTIPLIERS[bool(self.would_make_again)]
+
+        # Clamp to [-1, 1] range
+        object.__setattr__(self, "_sentiment", max(-1.0, min(1.0, score)))
+
     @property
     def is_positive(self) -> bool:
         """Check if this is positive feedback (rating >= 4).
@@ -58,21 +73,12 @@ class Feedback:
         return self.rating <= 2
 
     def get_sentiment_score(self) -> float:
-        """Calculate a sentiment score combining rating and would_make_again.
+        """Get the sentiment score combining rating and would_make_again.
 
-        The score ranges from -1.0 (worst) to 1.0 (best).
+        The score is computed once at construction and ranges from -1.0 (worst) to 1.0 (best).
         Formula: ((rating - 3) / 2) * (1.2 if would_make_again else 0.8)
 
         Returns:
             Sentiment score between -1.0 and 1.0
         """
-        # Normalize rating to -1 to 1 range (rating 3 = neutral 0)
-        normalized_rating = (self.rating - 3) / 2
-
-        # Boost or reduce based on would_make_again
-        multiplier = 1.2 if self.would_make_again else 0.8
-
-        score = normalized_rating * multiplier
-
-        # Clamp to [-1, 1] range
-        return max(-1.0, min(1.0, score))
+        return self._sentiment
@@ -8,10 +8,14 @@ from datetime import date
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class GroceryItem:
     """A single item on a grocery list.
 
+    `name`, `unit` and `category` should be treated as read-only once the item
+    is created, because GroceryList indexes items by their lowercased values.
+    Quantity, sources and purchase state may change.
+
     Attributes:
         name: Ingredient name
         quantity: Total quantity needed
@@ -29,6 +33,15 @@ class GroceryItem:
     recipe_sources: list[str] = field(default_factory=list)
     is_purchased: bool = False
     notes: Optional[str] = None
+    _name_lower: str = field(init=False, repr=False, compare=False)
+    _unit_lower: str = field(init=False, repr=False, compare=False)
+    _category_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Cache lowercased name, unit and category for case-insensitive lookups."""
+        self._name_lower = self.name.lower()
+        self._unit_lower = self.unit.lower()
+        self._category_lower = self.category.lower()
 
     def add_quantity(self, additional_quantity: float) -> None:
         """Add to the quantity of this item.
@@ -47,10 +60,13 @@ class GroceryItem:
         self.is_purchased = False
 
 
-@dataclass
+@dataclass(slots=True)
 class GroceryList:
     """A consolidated grocery list for a meal plan.
 
+    Items should be added through `add_item` or `consolidate_item` so the
+    lookup indices stay in sync with `items`.
+
     Attributes:
         id: Unique identifier
         meal_plan_id: ID of the associated meal plan
@@ -64,6 +80,34 @@ class GroceryList:
     items: list[GroceryItem] = field(default_factory=list)
     created_at: Optional[date] = None
     week_start_date: Optional[date] = None
+    _index: dict[tuple[str, str], GroceryItem] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _by_name: dict[str, GroceryItem] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _by_category: dict[str, list[GroceryItem]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Build lookup indices for any initial items."""
+        # Own the list so later changes to the caller's list cannot bypass the indices
+        self.items = list(self.items)
+        for item in self.items:
+            self._track_item(item)
+
+    def _track_item(self, item: GroceryItem) -> None:
+        """Register an item in the lookup indices.
+
+        The first item seen for a key wins, matching a front-to-back scan of `items`.
+
+        Args:
+            item: GroceryItem to track
+        """
+        self._index.setdefault((item._name_lower, item._unit_lower), item)
+        self._by_name.setdefault(item._name_lower, item)
+        self._by_category.setdefault(item._category_lower, []).append(item)
 
     def add_item(self, item: GroceryItem) -> None:
         """Add an item to the grocery list.
@@ -72,12 +116,13 @@ class GroceryList:
             item: GroceryItem to add
         """
         self.items.append(item)
+        self._track_item(item)
 
     def consolidate_item(self, name: str, quantity: float, unit: str, recipe_id: str) -> None:
         """Add or consolidate an ingredient into the grocery list.
 
         If an item with the same name and unit exists, add to its quantity.
-        Otherwise, create a new item.
+        Otherwise, create a new item. Name and unit are compared case-insensitively.
 
         Args:
             name: Ingredient name
@@ -85,15 +130,13 @@ class GroceryList:
             unit: Measurement unit
             recipe_id: Source recipe ID
         """
-        name_lower = name.lower()
-
         # Look for existing item with same name and unit
-        for item in self.items:
-            if item.name.lower() == name_lower and item.unit == unit:
-                item.add_quantity(quantity)
-                if recipe_id not in item.recipe_sources:
-                    item.recipe_sources.append(recipe_id)
-                return
+        existing = self._index.get((name.lower(), unit.lower()))
+        if existing is not None:
+            existing.add_quantity(quantity)
+            if recipe_id not in existing.recipe_sources:
+                existing.recipe_sources.append(recipe_id)
+            return
 
         # Create new item if not found
         new_item = GroceryItem(name=name, quantity=quantity, unit=unit, recipe_sources=[recipe_id])
@@ -108,7 +151,7 @@ class GroceryList:
         Returns:
             List of items in that category
         """
-        return [item for item in self.items if item.category.lower() == category.lower()]
+        return list(self._by_category.get(category.lower(), ()))
 
     def get_all_categories(self) -> list[str]:
         """Get all unique categories in this list.
@@ -136,12 +179,11 @@ class GroceryList:
         Returns:
             True if item was found and marked, False otherwise
         """
-        item_name_lower = item_name.lower()
-        for item in self.items:
-            if item.name.lower() == item_name_lower:
-                item.mark_purchased()
-                return True
-        return False
+        item = self._by_name.get(item_name.lower())
+        if item is None:
+            return False
+        item.mark_purchased()
+        return True
 
     @property
     def total_items(self) -> int:
@@ -8,7 +8,7 @@ from datetime import date
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MealSlot:
     """A single meal slot in a meal plan.
 
@@ -30,10 +30,14 @@ class MealSlot:
             raise ValueError(f"Servings must be at least 1, got {self.servings}")
 
 
-@dataclass
+@dataclass(slots=True)
 class MealPlan:
     """A meal plan containing multiple meal slots.
 
+    A plan holds at most one meal per date. Meals are indexed by date, so they
+    should be changed through `add_meal`, `remove_meal` and `swap_meal` rather
+    than by mutating `meals` directly.
+
     Attributes:
         id: Unique identifier
         user_id: ID of the user who owns this plan
@@ -49,13 +53,51 @@ class MealPlan:
     meals: list[MealSlot] = field(default_factory=list)
     created_at: Optional[date] = None
     is_active: bool = True
+    _by_date: dict[date, MealSlot] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _min_date: Optional[date] = field(default=None, init=False, repr=False, compare=False)
+    _max_date: Optional[date] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Index initial meals by date.
+
+        Raises:
+            ValueError: If two meals share the same date
+        """
+        # Own the list so later changes to the caller's list cannot bypass the index
+        self.meals = list(self.meals)
+        for meal in self.meals:
+            self._index_meal(meal)
+
+    def _index_meal(self, meal: MealSlot) -> None:
+        """Register a meal in the date index and running date range.
+
+        Args:
+            meal: MealSlot to index
+
+        Raises:
+            ValueError: If the plan already has a meal on that date
+        """
+        if meal.date in self._by_date:
+            raise ValueError(f"Meal plan already has a meal on {meal.date.isoformat()}")
+        self._by_date[meal.date] = meal
+
+        if self._min_date is None or meal.date < self._min_date:
+            self._min_date = meal.date
+        if self._max_date is None or meal.date > self._max_date:
+            self._max_date = meal.date
 
     def add_meal(self, meal: MealSlot) -> None:
         """Add a meal to the plan.
 
         Args:
             meal: MealSlot to add
+
+        Raises:
+            ValueError: If the plan already has a meal on that date
         """
+        self._index_meal(meal)
         self.meals.append(meal)
 
     def remove_meal(self, meal_date: date) -> bool:
@@ -67,9 +109,16 @@ class MealPlan:
         Returns:
             True if a meal was removed, False if not found
         """
-        original_length = len(self.meals)
-        self.meals = [meal for meal in self.meals if meal.date != meal_date]
-        return len(self.meals) < original_length
+        meal = self._by_date.pop(meal_date, None)
+        if meal is None:
+            return False
+        self.meals.remove(meal)
+
+        # Only rescan when a boundary of the date range was removed
+        if meal_date == self._min_date or meal_date == self._max_date:
+            self._min_date = min(self._by_date, default=None)
+            self._max_date = max(self._by_date, default=None)
+        return True
 
     def get_meal_by_date(self, meal_date: date) -> Optional[MealSlot]:
         """Get a meal from the plan by date.
@@ -80,10 +129,17 @@ class MealPlan:
         Returns:
             MealSlot if found, None otherwise
         """
-        for meal in self.meals:
-            if meal.date == meal_date:
-                return meal
-        return None
+        return self._by_date.get(meal_date)
+
+    def get_unique_recipe_ids(self) -> frozenset[str]:
+        """Get the set of unique recipe IDs in this plan.
+
+        Prefer this over `get_all_recipe_ids` when only membership or iteration is needed.
+
+        Returns:
+            Frozenset of unique recipe IDs
+        """
+        return frozenset(meal.recipe_id for meal in self.meals)
 
     def get_all_recipe_ids(self) -> list[str]:
         """Get all unique recipe IDs in this plan.
@@ -91,7 +147,7 @@ class MealPlan:
         Returns:
             List of unique recipe IDs
         """
-        return list({meal.recipe_id for meal in self.meals})
+        return list(self.get_unique_recipe_ids())
 
     def swap_meal(self, meal_date: date, new_recipe_id: str, new_servings: int) -> bool:
         """Swap a meal in the plan with a new recipe.
@@ -104,16 +160,19 @@ class MealPlan:
         Returns:
             True if swap was successful, False if date not found
         """
-        for i, meal in enumerate(self.meals):
-            if meal.date == meal_date:
-                self.meals[i] = MealSlot(
-                    date=meal_date,
-                    recipe_id=new_recipe_id,
-                    servings=new_servings,
-                    notes=meal.notes,
-                )
-                return True
-        return False
+        meal = self._by_date.get(meal_date)
+        if meal is None:
+            return False
+
+        new_meal = MealSlot(
+            date=meal_date,
+            recipe_id=new_recipe_id,
+            servings=new_servings,
+            notes=meal.notes,
+        )
+        self.meals[self.meals.index(meal)] = new_meal
+        self._by_date[meal_date] = new_meal
+        return True
 
     def get_date_range(self) -> tuple[date, date]:
         """Get the date range covered by this meal plan.
@@ -121,8 +180,6 @@ class MealPlan:
         Returns:
             Tuple of (earliest_date, latest_date), or (week_start_date, week_start_date) if no meals
         """
-        if not self.meals:
+        if self._min_date is None or self._max_date is None:
             return (self.week_start_date, self.week_start_date)
-
-        dates = [meal.date for meal in self.meals]
-        return (min(dates), max(dates))
+        return (self._min_date, self._max_date)
@@ -3,11 +3,13 @@
 This module contains the Recipe entity and related value objects.
 """
 
-from dataclasses import dataclass, field
+import sys
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field, replace
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Ingredient:
     """An ingredient with quantity and unit.
 
@@ -22,6 +24,17 @@ class Ingredient:
     quantity: float
     unit: str
     notes: Optional[str] = None
+    _name_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Intern name and unit and cache the lowercased name for matching.
+
+        The same few names and units repeat across every recipe, so interning
+        lets equal strings share one object.
+        """
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "unit", sys.intern(self.unit))
+        object.__setattr__(self, "_name_lower", sys.intern(self.name.lower()))
 
     def scale(self, factor: float) -> "Ingredient":
         """Scale ingredient quantity by a factor.
@@ -32,18 +45,16 @@ class Ingredient:
         Returns:
             New Ingredient with scaled quantity
         """
-        return Ingredient(
-            name=self.name,
-            quantity=self.quantity * factor,
-            unit=self.unit,
-            notes=self.notes,
-        )
+        return replace(self, quantity=self.quantity * factor)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Recipe:
     """A recipe with ingredients and instructions.
 
+    Recipes are immutable. Sequence fields are stored as tuples, and lookup data
+    derived from the ingredient list is built once in `__post_init__`.
+
     Attributes:
         id: Unique identifier
         title: Recipe name
@@ -51,7 +62,7 @@ class Recipe:
         servings: Number of servings this recipe makes
         prep_time_minutes: Preparation time
         cook_time_minutes: Cooking time
-        ingredients: List of ingredients
+        ingredients: Ingredients, stored as a tuple
         instructions: Step-by-step cooking instructions
         dietary_tags: Dietary restriction tags (e.g., "vegetarian", "gluten_free")
         cuisine: Cuisine type (e.g., "italian", "mexican", "thai")
@@ -60,6 +71,7 @@ class Recipe:
         image_url: Optional URL to recipe image
         source_url: Optional URL to original recipe
         rating: Optional average rating (1-5)
+        total_time_minutes: Total time (prep + cook), computed at construction
     """
 
     id: str
@@ -68,29 +80,42 @@ class Recipe:
     servings: int
     prep_time_minutes: int
     cook_time_minutes: int
-    ingredients: list[Ingredient]
-    instructions: list[str]
-    dietary_tags: list[str] = field(default_factory=list)
+    ingredients: Sequence[Ingredient]
+    instructions: Sequence[str]
+    dietary_tags: Sequence[str] = ()
     cuisine: str = "other"
     difficulty: str = "medium"
     protein_type: str = "none"
     image_url: Optional[str] = None
     source_url: Optional[str] = None
     rating: Optional[float] = None
+    total_time_minutes: int = field(init=False, compare=False)
+    _ingredient_names_lower: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _ingredient_tokens: frozenset[str] = field(init=False, repr=False, compare=False)
+    _dietary_tags_lower: frozenset[str] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Validate recipe data."""
+        """Validate recipe data, freeze sequences and build lowercased lookup data."""
         if self.servings < 1:
             raise ValueError(f"Servings must be at least 1, got {self.servings}")
 
-    @property
-    def total_time_minutes(self) -> int:
-        """Calculate total time (prep + cook).
+        object.__setattr__(self, "ingredients", tuple(self.ingredients))
+        object.__setattr__(self, "instructions", tuple(self.instructions))
+        object.__setattr__(self, "dietary_tags", tuple(self.dietary_tags))
+        object.__setattr__(
+            self, "total_time_minutes", self.prep_time_minutes + self.cook_time_minutes
+        )
 
-        Returns:
-            Total time in minutes
-        """
-        return self.prep_time_minutes + self.cook_time_minutes
+        names_lower = tuple(ing._name_lower for ing in self.ingredients)
+        object.__setattr__(self, "_ingredient_names_lower", names_lower)
+        object.__setattr__(
+            self,
+            "_ingredient_tokens",
+            frozenset(token for name in names_lower for token in name.split()),
+        )
+        object.__setattr__(
+            self, "_dietary_tags_lower", frozenset(tag.lower() for tag in self.dietary_tags)
+        )
 
     def scale(self, new_servings: int) -> "Recipe":
         """Scale recipe to a different number of servings.
@@ -134,18 +159,19 @@ class Recipe:
             rating=self.rating,
         )
 
-    def meets_dietary_requirements(self, required_tags: list[str]) -> bool:
+    def meets_dietary_requirements(self, required_tags: Iterable[str]) -> bool:
         """Check if recipe meets all dietary requirements.
 
+        Stops at the first tag the recipe does not have.
+
         Args:
-            required_tags: List of required dietary tags (case-insensitive)
+            required_tags: Required dietary tags (case-insensitive)
 
         Returns:
             True if recipe has all required tags
         """
-        recipe_tags_lower = {tag.lower() for tag in self.dietary_tags}
-        required_tags_lower = {tag.lower() for tag in required_tags}
-        return required_tags_lower.issubset(recipe_tags_lower)
+        tags = self._dietary_tags_lower
+        return all(tag.lower() in tags for tag in required_tags)
 
     def has_ingredient(self, ingredient_name: str) -> bool:
         """Check if recipe contains a specific ingredient.
@@ -157,4 +183,8 @@ class Recipe:
             True if ingredient is found
         """
         ingredient_name_lower = ingredient_name.lower()
-        return any(ingredient_name_lower in ing.name.lower() for ing in self.ingredients)
+
+        # Whole-word queries ("chicken", "tofu") hit the token set directly
+        if ingredient_name_lower in self._ingredient_tokens:
+            return True
+        return any(ingredient_name_lower in name for name in self._ingredient_names_lower)
@@ -3,14 +3,20 @@
 This module contains the UserProfile entity representing user preferences.
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UserProfile:
     """User profile with dietary preferences and constraints.
 
+    Profiles are immutable so the lowercased lookup sets built in `__post_init__`
+    can never go stale. Edit a profile with `dataclasses.replace`, which runs
+    `__post_init__` again on the new instance. Preference sequences are stored
+    as tuples.
+
     Attributes:
         id: Unique identifier
         name: User's display name
@@ -27,13 +33,39 @@ class UserProfile:
     id: str
     name: str
     household_size: int = 2
-    dietary_restrictions: list[str] = field(default_factory=list)
-    disliked_ingredients: list[str] = field(default_factory=list)
-    cuisine_preferences: list[str] = field(default_factory=list)
+    dietary_restrictions: Sequence[str] = ()
+    disliked_ingredients: Sequence[str] = ()
+    cuisine_preferences: Sequence[str] = ()
     max_prep_time_minutes: Optional[int] = None
     max_cook_time_minutes: Optional[int] = None
     skill_level: str = "intermediate"
-    avoid_protein_types: list[str] = field(default_factory=list)
+    avoid_protein_types: Sequence[str] = ()
+    _dietary_lower: frozenset[str] = field(init=False, repr=False, compare=False)
+    _disliked_lower: frozenset[str] = field(init=False, repr=False, compare=False)
+    _cuisine_lower: frozenset[str] = field(init=False, repr=False, compare=False)
+    _avoid_protein_lower: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Freeze preference sequences and cache their lowercased values."""
+        object.__setattr__(self, "dietary_restrictions", tuple(self.dietary_restrictions))
+        object.__setattr__(self, "disliked_ingredients", tuple(self.disliked_ingredients))
+        object.__setattr__(self, "cuisine_preferences", tuple(self.cuisine_preferences))
+        object.__setattr__(self, "avoid_protein_types", tuple(self.avoid_protein_types))
+
+        object.__setattr__(
+            self, "_dietary_lower", frozenset(tag.lower() for tag in self.dietary_restrictions)
+        )
+        object.__setattr__(
+            self, "_disliked_lower", frozenset(item.lower() for item in self.disliked_ingredients)
+        )
+        object.__setattr__(
+            self, "_cuisine_lower", frozenset(c.lower() for c in self.cuisine_preferences)
+        )
+        object.__setattr__(
+            self,
+            "_avoid_protein_lower",
+            frozenset(protein.lower() for protein in self.avoid_protein_types),
+        )
 
     @property
     def max_total_time_minutes(self) -> Optional[int]:
@@ -55,8 +87,7 @@ class UserProfile:
         Returns:
             True if user has this restriction
         """
-        tag_lower = tag.lower()
-        return any(tag_lower == restriction.lower() for restriction in self.dietary_restrictions)
+        return tag.lower() in self._dietary_lower
 
     def dislikes_ingredient(self, ingredient_name: str) -> bool:
         """Check if user dislikes a specific ingredient.
@@ -68,7 +99,20 @@ class UserProfile:
             True if user dislikes this ingredient
         """
         ingredient_lower = ingredient_name.lower()
-        return any(ingredient_lower in disliked.lower() for disliked in self.disliked_ingredients)
+        if ingredient_lower in self._disliked_lower:
+            return True
+        return any(ingredient_lower in disliked for disliked in self._disliked_lower)
+
+    def prefers_cuisine(self, cuisine: str) -> bool:
+        """Check if user prefers a specific cuisine.
+
+        Args:
+            cuisine: Cuisine to check (case-insensitive)
+
+        Returns:
+            True if this cuisine is among the user's preferences
+        """
+        return cuisine.lower() in self._cuisine_lower
 
     def avoids_protein(self, protein_type: str) -> bool:
         """Check if user avoids a specific protein type.
@@ -79,5 +123,4 @@ class UserProfile:
         Returns:
             True if user avoids this protein
         """
-        protein_lower = protein_type.lower()
-        return any(protein_lower == avoided.lower() for avoided in self.avoid_protein_types)
+        return protein_type.lower() in self._avoid_protein_lower
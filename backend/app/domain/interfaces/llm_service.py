@@ -5,6 +5,7 @@ Any implementation (Ollama, Bedrock, OpenAI, etc.) must follow this interface.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 from ..exceptions import LLMError
 
@@ -53,6 +54,31 @@ class ILLMService(ABC):
         """
         pass
 
+    @abstractmethod
+    def generate_batch(
+        self,
+        prompts: Sequence[str],
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+    ) -> list[str]:
+        """Generate text for several independent prompts.
+
+        Implementations should issue the requests concurrently or as a single
+        batched call rather than one round-trip after another.
+
+        Args:
+            prompts: Prompts to send to the LLM
+            temperature: Sampling temperature (0.0-1.0)
+            max_tokens: Maximum tokens in each response
+
+        Returns:
+            Generated text responses, in the same order as `prompts`
+
+        Raises:
+            LLMError: If any generation fails
+        """
+        pass
+
     @abstractmethod
     def is_available(self) -> bool:
         """Check if the LLM service is available and healthy.
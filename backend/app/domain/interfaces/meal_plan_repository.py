@@ -5,6 +5,7 @@ Any implementation (SQLite, DynamoDB, etc.) must follow this interface.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from datetime import date
 from typing import Optional
 
@@ -39,6 +40,21 @@ class IMealPlanRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_by_ids(self, plan_ids: Sequence[str]) -> list[MealPlan]:
+        """Retrieve several meal plans in a single batch.
+
+        Implementations should fetch all IDs in as few round-trips as the backend
+        allows rather than calling `get_by_id` once per ID.
+
+        Args:
+            plan_ids: Unique meal plan identifiers; duplicates are ignored
+
+        Returns:
+            MealPlans that were found, in no particular order; missing IDs are skipped
+        """
+        pass
+
     @abstractmethod
     def get_active_by_user(self, user_id: str) -> Optional[MealPlan]:
         """Retrieve the active meal plan for a user.
@@ -87,3 +103,15 @@ class IMealPlanRepository(ABC):
             True if meal plan exists, False otherwise
         """
         pass
+
+    @abstractmethod
+    def exists_many(self, plan_ids: Sequence[str]) -> set[str]:
+        """Check which of several meal plans exist in the repository.
+
+        Args:
+            plan_ids: Unique meal plan identifiers
+
+        Returns:
+            Subset of the given IDs that exist
+        """
+        pass
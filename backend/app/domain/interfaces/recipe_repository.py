@@ -5,6 +5,7 @@ Any implementation (SQLite, DynamoDB, etc.) must follow this interface.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator, Sequence
 from typing import Optional
 
 from ..entities.recipe import Recipe
@@ -26,6 +27,18 @@ class IRecipeRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def save_many(self, recipes: Sequence[Recipe]) -> None:
+        """Save several recipes using as few backend writes as possible.
+
+        Args:
+            recipes: Recipe entities to save
+
+        Raises:
+            RecipeError: If any save fails
+        """
+        pass
+
     @abstractmethod
     def get_by_id(self, recipe_id: str) -> Optional[Recipe]:
         """Retrieve a recipe by its ID.
@@ -38,6 +51,21 @@ class IRecipeRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_by_ids(self, recipe_ids: Sequence[str]) -> list[Recipe]:
+        """Retrieve several recipes in a single batch.
+
+        Implementations should fetch all IDs in as few round-trips as the backend
+        allows rather than calling `get_by_id` once per ID.
+
+        Args:
+            recipe_ids: Unique recipe identifiers; duplicates are ignored
+
+        Returns:
+            Recipes that were found, in no particular order; missing IDs are skipped
+        """
+        pass
+
     @abstractmethod
     def get_all(self) -> list[Recipe]:
         """Retrieve all recipes from the repository.
@@ -47,6 +75,18 @@ class IRecipeRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def iter_all(self) -> Iterator[Recipe]:
+        """Stream all recipes from the repository.
+
+        Unlike `get_all`, implementations should yield recipes page by page as
+        the backend returns them instead of loading the whole table first.
+
+        Returns:
+            Iterator over all recipes
+        """
+        pass
+
     @abstractmethod
     def delete(self, recipe_id: str) -> bool:
         """Delete a recipe from the repository.
@@ -70,3 +110,15 @@ class IRecipeRepository(ABC):
             True if recipe exists, False otherwise
         """
         pass
+
+    @abstractmethod
+    def exists_many(self, recipe_ids: Sequence[str]) -> set[str]:
+        """Check which of several recipes exist in the repository.
+
+        Args:
+            recipe_ids: Unique recipe identifiers
+
+        Returns:
+            Subset of the given IDs that exist
+        """
+        pass
@@ -5,6 +5,7 @@ Any implementation (SQLite, DynamoDB, etc.) must follow this interface.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import Optional
 
 from ..entities.user_profile import UserProfile
@@ -38,6 +39,21 @@ class IUserRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_by_ids(self, user_ids: Sequence[str]) -> list[UserProfile]:
+        """Retrieve several user profiles in a single batch.
+
+        Implementations should fetch all IDs in as few round-trips as the backend
+        allows rather than calling `get_by_id` once per ID.
+
+        Args:
+            user_ids: Unique user identifiers; duplicates are ignored
+
+        Returns:
+            UserProfiles that were found, in no particular order; missing IDs are skipped
+        """
+        pass
+
     @abstractmethod
     def delete(self, user_id: str) -> bool:
         """Delete a user profile from the repository.
@@ -61,3 +77,15 @@ class IUserRepository(ABC):
             True if user exists, False otherwise
         """
         pass
+
+    @abstractmethod
+    def exists_many(self, user_ids: Sequence[str]) -> set[str]:
+        """Check which of several users exist in the repository.
+
+        Args:
+            user_ids: Unique user identifiers
+
+        Returns:
+            Subset of the given IDs that exist
+        """
+        pass
@@ -5,6 +5,7 @@ Any implementation (Milvus, Zilliz Cloud, Pinecone, etc.) must follow this inter
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 from ..entities.recipe import Recipe
 from ..exceptions import VectorStoreError
@@ -27,7 +28,23 @@ class IVectorStore(ABC):
         pass
 
     @abstractmethod
-    def search_similar(self, query_embedding: list[float], limit: int = 10) -> list[str]:
+    def index_recipes(self, recipes: Sequence[Recipe], embeddings: Sequence[list[float]]) -> None:
+        """Index several recipes with their embedding vectors in one bulk operation.
+
+        Args:
+            recipes: Recipe entities to index
+            embeddings: Vector embeddings, one per recipe in the same order
+
+        Raises:
+            VectorStoreError: If indexing operation fails
+            ValueError: If recipes and embeddings differ in length
+        """
+        pass
+
+    @abstractmethod
+    def search_similar(
+        self, query_embedding: list[float], limit: int = 10
+    ) -> list[tuple[str, float]]:
         """Search for similar recipes by embedding similarity.
 
         Args:
@@ -35,7 +52,22 @@ class IVectorStore(ABC):
             limit: Maximum number of results to return
 
         Returns:
-            List of recipe IDs ordered by similarity (most similar first)
+            (recipe ID, similarity score) pairs ordered by similarity (most similar first)
+        """
+        pass
+
+    @abstractmethod
+    def search_similar_batch(
+        self, query_embeddings: Sequence[list[float]], limit: int = 10
+    ) -> list[list[tuple[str, float]]]:
+        """Search for similar recipes for several queries in one request.
+
+        Args:
+            query_embeddings: Query vector embeddings
+            limit: Maximum number of results to return per query
+
+        Returns:
+            One result list per query, in query order, each shaped like `search_similar`
         """
         pass
 
@@ -0,0 +1,12 @@
+"""In-process caching for infrastructure adapters."""
+
+from app.infrastructure.cache.llm_cache import CachedLLMService
+from app.infrastructure.cache.repo_cache import CachedRecipeRepository, CachedUserRepository
+from app.infrastructure.cache.ttl_cache import TTLCache
+
+__all__ = [
+    "CachedLLMService",
+    "CachedRecipeRepository",
+    "CachedUserRepository",
+    "TTLCache",
+]
@@ -0,0 +1,170 @@
+"""Response caching decorator for LLM services.
+
+Wraps another LLM service and reuses responses for identical requests made at
+low sampling temperatures, where the model output is close to deterministic.
+"""
+
+from collections.abc import Sequence
+from typing import Optional
+
+from app.domain.interfaces import ILLMService
+from app.infrastructure.cache.ttl_cache import TTLCache
+
+# (system_prompt, prompt, temperature, max_tokens)
+_CacheKey = tuple[Optional[str], str, float, int]
+
+
+class CachedLLMService(ILLMService):
+    """LLM service decorator that caches responses by exact request.
+
+    Requests above `max_cached_temperature` always go to the wrapped service so
+    creative generations are not repeated.
+
+    Attributes:
+        hits: Number of generations served from the cache
+        misses: Number of cacheable generations delegated to the wrapped service;
+            a prompt repeated within one batch counts once
+    """
+
+    def __init__(
+        self,
+        inner: ILLMService,
+        max_cached_temperature: float = 0.3,
+        maxsize: int = 1_000,
+        ttl_seconds: float = 86_400.0,
+    ) -> None:
+        """Wrap an LLM service.
+
+        Args:
+            inner: Service that performs the generation
+            max_cached_temperature: Highest temperature whose responses are cached
+            maxsize: Maximum number of responses kept in memory
+            ttl_seconds: Seconds a cached response stays valid
+        """
+        self._inner = inner
+        self._max_cached_temperature = max_cached_temperature
+        self._responses: TTLCache[_CacheKey, str] = TTLCache(
+            maxsize=maxsize, ttl_seconds=ttl_seconds
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, key: _CacheKey) -> Optional[str]:
+        """Return a cached response for a cacheable request, counting the outcome."""
+        response = self._responses.get(key)
+        if response is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return response
+
+    def generate(self, prompt: str, temperature: float = 0.7, max_tokens: int = 2000) -> str:
+        """Generate text, reusing a cached response when possible.
+
+        Args:
+            prompt: The prompt to send to the LLM
+            temperature: Sampling temperature (0.0-1.0, higher = more creative)
+            max_tokens: Maximum tokens in response
+
+        Returns:
+            Generated text response
+
+        Raises:
+            LLMError: If generation fails
+        """
+        if temperature > self._max_cached_temperature:
+            return self._inner.generate(prompt, temperature, max_tokens)
+
+        key: _CacheKey = (None, prompt, temperature, max_tokens)
+        response = self._lookup(key)
+        if response is None:
+            response = self._inner.generate(prompt, temperature, max_tokens)
+            self._responses.set(key, response)
+        return response
+
+    def generate_with_system_prompt(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+    ) -> str:
+        """Generate text from system and user prompts, reusing cached responses.
+
+        Args:
+            system_prompt: System message that sets context and behavior
+            user_prompt: User query or instruction
+            temperature: Sampling temperature (0.0-1.0)
+            max_tokens: Maximum tokens in response
+
+        Returns:
+            Generated text response
+
+        Raises:
+            LLMError: If generation fails
+        """
+        if temperature > self._max_cached_temperature:
+            return self._inner.generate_with_system_prompt(
+                system_prompt, user_prompt, temperature, max_tokens
+            )
+
+        key: _CacheKey = (system_prompt, user_prompt, temperature, max_tokens)
+        response = self._lookup(key)
+        if response is None:
+            response = self._inner.generate_with_system_prompt(
+                system_prompt, user_prompt, temperature, max_tokens
+            )
+            self._responses.set(key, response)
+        return response
+
+    def generate_batch(
+        self,
+        prompts: Sequence[str],
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+    ) -> list[str]:
+        """Generate text for several prompts, batching only uncached ones.
+
+        Args:
+            prompts: Prompts to send to the LLM
+            temperature: Sampling temperature (0.0-1.0)
+            max_tokens: Maximum tokens in each response
+
+        Returns:
+            Generated text responses, in the same order as `prompts`
+
+        Raises:
+            LLMError: If any generation fails
+        """
+        if temperature > self._max_cached_temperature:
+            return self._inner.generate_batch(prompts, temperature, max_tokens)
+
+        # Look up each distinct prompt once so duplicates count as one hit or miss
+        resolved: dict[str, str] = {}
+        missing: list[str] = []
+        for prompt in dict.fromkeys(prompts):
+            response = self._lookup((None, prompt, temperature, max_tokens))
+            if response is None:
+                missing.append(prompt)
+            else:
+                resolved[prompt] = response
+
+        if missing:
+            batch = self._inner.generate_batch(missing, temperature, max_tokens)
+            for prompt, response in zip(missing, batch, strict=True):
+                self._responses.set((None, prompt, temperature, max_tokens), response)
+                resolved[prompt] = response
+
+        return [resolved[prompt] for prompt in prompts]
+
+    def is_available(self) -> bool:
+        """Check if the wrapped LLM service is available and healthy.
+
+        Returns:
+            True if service is available, False otherwise
+        """
+        return self._inner.is_available()
+
+    def clear_cache(self) -> None:
+        """Drop every cached response."""
+        self._responses.clear()
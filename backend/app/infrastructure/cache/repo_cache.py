@@ -0,0 +1,368 @@
+"""Read-through caching decorators for repositories.
+
+These wrap another repository implementation and serve point lookups from an
+in-process TTL cache, keyed by entity ID. Writes go to the wrapped repository
+first and then refresh or invalidate the cached entry. Values read from the
+wrapped repository are cached only if no write or invalidation happened while
+they were being loaded (see `TTLCache.set_if_generation`), so a lookup racing a
+delete or save cannot put a stale entity back into the cache.
+"""
+
+from collections.abc import Iterator, Sequence
+from typing import Optional
+
+from app.domain.entities import Recipe, UserProfile
+from app.domain.interfaces import IRecipeRepository, IUserRepository
+from app.infrastructure.cache.ttl_cache import TTLCache
+
+_ALL_KEY = "__all__"
+
+
+class CachedRecipeRepository(IRecipeRepository):
+    """Recipe repository decorator that caches recipes by ID.
+
+    Only found recipes are cached; a miss always falls through to the wrapped
+    repository so recipes saved elsewhere become visible immediately. Recipes
+    loaded while a write or delete runs are returned but not cached. The full
+    `get_all` result is cached separately with a shorter TTL and dropped on any
+    write made through this repository.
+
+    Attributes:
+        hits: Number of lookups served from the cache
+        misses: Number of lookups delegated to the wrapped repository
+    """
+
+    def __init__(
+        self,
+        inner: IRecipeRepository,
+        maxsize: int = 10_000,
+        ttl_seconds: float = 60.0,
+        all_ttl_seconds: float = 30.0,
+    ) -> None:
+        """Wrap a recipe repository.
+
+        Args:
+            inner: Repository that owns the data
+            maxsize: Maximum number of recipes kept in memory
+            ttl_seconds: Seconds a cached recipe stays valid
+            all_ttl_seconds: Seconds a cached `get_all` result stays valid
+        """
+        self._inner = inner
+        self._by_id: TTLCache[str, Recipe] = TTLCache(maxsize=maxsize, ttl_seconds=ttl_seconds)
+        self._all: TTLCache[str, tuple[Recipe, ...]] = TTLCache(
+            maxsize=1, ttl_seconds=all_ttl_seconds
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def save(self, recipe: Recipe) -> None:
+        """Save a recipe and cache it.
+
+        Args:
+            recipe: Recipe entity to save
+
+        Raises:
+            RecipeError: If save operation fails
+        """
+        self._inner.save(recipe)
+        self._all.clear()
+        self._by_id.set(recipe.id, recipe)
+
+    def save_many(self, recipes: Sequence[Recipe]) -> None:
+        """Save several recipes and cache them.
+
+        Args:
+            recipes: Recipe entities to save
+
+        Raises:
+            RecipeError: If any save fails
+        """
+        try:
+            self._inner.save_many(recipes)
+        except BaseException:
+            # Some recipes may already be written; stop serving older cached copies
+            for recipe in recipes:
+                self._by_id.discard(recipe.id)
+            raise
+        finally:
+            # A partially applied bulk write still changes the full listing
+            self._all.clear()
+        for recipe in recipes:
+            self._by_id.set(recipe.id, recipe)
+
+    def get_by_id(self, recipe_id: str) -> Optional[Recipe]:
+        """Retrieve a recipe, serving it from the cache when possible.
+
+        Args:
+            recipe_id: Unique recipe identifier
+
+        Returns:
+            Recipe if found, None otherwise
+        """
+        recipe = self._by_id.get(recipe_id)
+        if recipe is not None:
+            self.hits += 1
+            return recipe
+
+        self.misses += 1
+        generation = self._by_id.generation
+        recipe = self._inner.get_by_id(recipe_id)
+        if recipe is not None:
+            self._by_id.set_if_generation(recipe_id, recipe, generation)
+        return recipe
+
+    def get_by_ids(self, recipe_ids: Sequence[str]) -> list[Recipe]:
+        """Retrieve several recipes, fetching only cache misses in one batch.
+
+        Args:
+            recipe_ids: Unique recipe identifiers; duplicates are ignored
+
+        Returns:
+            Recipes that were found, in no particular order; missing IDs are skipped
+        """
+        found: list[Recipe] = []
+        missing: list[str] = []
+        generation = self._by_id.generation
+        for recipe_id in dict.fromkeys(recipe_ids):
+            recipe = self._by_id.get(recipe_id)
+            if recipe is None:
+                missing.append(recipe_id)
+            else:
+                found.append(recipe)
+
+        self.hits += len(found)
+        self.misses += len(missing)
+        if missing:
+            for recipe in self._inner.get_by_ids(missing):
+                self._by_id.set_if_generation(recipe.id, recipe, generation)
+                found.append(recipe)
+        return found
+
+    def get_all(self) -> list[Recipe]:
+        """Retrieve all recipes, reusing a recently cached result.
+
+        Returns:
+            List of all recipes
+        """
+        cached = self._all.get(_ALL_KEY)
+        if cached is not None:
+            self.hits += 1
+            return list(cached)
+
+        self.misses += 1
+        all_generation = self._all.generation
+        generation = self._by_id.generation
+        recipes = self._inner.get_all()
+        self._all.set_if_generation(_ALL_KEY, tuple(recipes), all_generation)
+        for recipe in recipes:
+            self._by_id.set_if_generation(recipe.id, recipe, generation)
+        return recipes
+
+    def iter_all(self) -> Iterator[Recipe]:
+        """Stream all recipes from the wrapped repository, caching each one.
+
+        Returns:
+            Iterator over all recipes
+        """
+        generation = self._by_id.generation
+        for recipe in self._inner.iter_all():
+            self._by_id.set_if_generation(recipe.id, recipe, generation)
+            yield recipe
+
+    def delete(self, recipe_id: str) -> bool:
+        """Delete a recipe and drop it from the cache.
+
+        Args:
+            recipe_id: Unique recipe identifier
+
+        Returns:
+            True if deleted, False if not found
+        """
+        try:
+            return self._inner.delete(recipe_id)
+        finally:
+            # Evicting bumps the cache generation, so lookups that read the
+            # recipe before the delete will not cache it
+            self._by_id.discard(recipe_id)
+            self._all.clear()
+
+    def exists(self, recipe_id: str) -> bool:
+        """Check if a recipe exists, answering from the cache when possible.
+
+        A miss is resolved with `get_by_id`, so a following lookup of the same
+        recipe is served from the cache.
+
+        Args:
+            recipe_id: Unique recipe identifier
+
+        Returns:
+            True if recipe exists, False otherwise
+        """
+        return self.get_by_id(recipe_id) is not None
+
+    def exists_many(self, recipe_ids: Sequence[str]) -> set[str]:
+        """Check which recipes exist, consulting the wrapped repository only on misses.
+
+        Args:
+            recipe_ids: Unique recipe identifiers
+
+        Returns:
+            Subset of the given IDs that exist
+        """
+        present: set[str] = set()
+        unknown: list[str] = []
+        for recipe_id in dict.fromkeys(recipe_ids):
+            if self._by_id.get(recipe_id) is None:
+                unknown.append(recipe_id)
+            else:
+                present.add(recipe_id)
+        if unknown:
+            present |= self._inner.exists_many(unknown)
+        return present
+
+    def clear_cache(self) -> None:
+        """Drop every cached recipe."""
+        self._by_id.clear()
+        self._all.clear()
+
+
+class CachedUserRepository(IUserRepository):
+    """User repository decorator that caches profiles by ID.
+
+    Profiles are frozen, so one cached instance is safely shared by every caller;
+    edits are new instances that only become visible once saved. `save`
+    invalidates the cached entry and the next lookup reloads the stored profile.
+
+    Attributes:
+        hits: Number of lookups served from the cache
+        misses: Number of lookups delegated to the wrapped repository
+    """
+
+    def __init__(
+        self,
+        inner: IUserRepository,
+        maxsize: int = 1_024,
+        ttl_seconds: float = 60.0,
+    ) -> None:
+        """Wrap a user repository.
+
+        Args:
+            inner: Repository that owns the data
+            maxsize: Maximum number of profiles kept in memory
+            ttl_seconds: Seconds a cached profile stays valid
+        """
+        self._inner = inner
+        self._by_id: TTLCache[str, UserProfile] = TTLCache(maxsize=maxsize, ttl_seconds=ttl_seconds)
+        self.hits = 0
+        self.misses = 0
+
+    def save(self, user: UserProfile) -> None:
+        """Save a user profile and invalidate its cached copy.
+
+        Args:
+            user: UserProfile entity to save
+
+        Raises:
+            UserError: If save operation fails
+        """
+        self._inner.save(user)
+        self._by_id.discard(user.id)
+
+    def get_by_id(self, user_id: str) -> Optional[UserProfile]:
+        """Retrieve a user profile, serving it from the cache when possible.
+
+        Args:
+            user_id: Unique user identifier
+
+        Returns:
+            UserProfile if found, None otherwise
+        """
+        user = self._by_id.get(user_id)
+        if user is not None:
+            self.hits += 1
+            return user
+
+        self.misses += 1
+        generation = self._by_id.generation
+        user = self._inner.get_by_id(user_id)
+        if user is not None:
+            self._by_id.set_if_generation(user_id, user, generation)
+        return user
+
+    def get_by_ids(self, user_ids: Sequence[str]) -> list[UserProfile]:
+        """Retrieve several user profiles, fetching only cache misses in one batch.
+
+        Args:
+            user_ids: Unique user identifiers; duplicates are ignored
+
+        Returns:
+            UserProfiles that were found, in no particular order; missing IDs are skipped
+        """
+        found: list[UserProfile] = []
+        missing: list[str] = []
+        generation = self._by_id.generation
+        for user_id in dict.fromkeys(user_ids):
+            user = self._by_id.get(user_id)
+            if user is None:
+                missing.append(user_id)
+            else:
+                found.append(user)
+
+        self.hits += len(found)
+        self.misses += len(missing)
+        if missing:
+            for user in self._inner.get_by_ids(missing):
+                self._by_id.set_if_generation(user.id, user, generation)
+                found.append(user)
+        return found
+
+    def delete(self, user_id: str) -> bool:
+        """Delete a user profile and drop it from the cache.
+
+        Args:
+            user_id: Unique user identifier
+
+        Returns:
+            True if deleted, False if not found
+        """
+        try:
+            return self._inner.delete(user_id)
+        finally:
+            # Evicting bumps the cache generation, so lookups that read the
+            # profile before the delete will not cache it
+            self._by_id.discard(user_id)
+
+    def exists(self, user_id: str) -> bool:
+        """Check if a user exists, answering from the cache when possible.
+
+        Args:
+            user_id: Unique user identifier
+
+        Returns:
+            True if user exists, False otherwise
+        """
+        return self.get_by_id(user_id) is not None
+
+    def exists_many(self, user_ids: Sequence[str]) -> set[str]:
+        """Check which users exist, consulting the wrapped repository only on misses.
+
+        Args:
+            user_ids: Unique user identifiers
+
+        Returns:
+            Subset of the given IDs that exist
+        """
+        present: set[str] = set()
+        unknown: list[str] = []
+        for user_id in dict.fromkeys(user_ids):
+            if self._by_id.get(user_id) is None:
+                unknown.append(user_id)
+            else:
+                present.add(user_id)
+        if unknown:
+            present |= self._inner.exists_many(unknown)
+        return present
+
+    def clear_cache(self) -> None:
+        """Drop every cached profile."""
+        self._by_id.clear()
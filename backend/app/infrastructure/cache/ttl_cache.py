@@ -0,0 +1,138 @@
+"""In-process TTL cache.
+
+A small least-recently-used cache whose entries also expire after a fixed
+time-to-live. Used by the caching repository and service decorators. All
+operations take an internal lock, so one cache can be shared across the worker
+threads that serve synchronous requests.
+
+Read-through callers that load a value from a slower source should capture
+`generation` before the load and store the result with `set_if_generation`.
+Every other write bumps the generation, so a value loaded before a concurrent
+update or invalidation is dropped instead of overwriting fresher state.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Generic, Optional, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded mapping with per-entry expiry and LRU eviction.
+
+    Attributes:
+        maxsize: Maximum number of live entries
+        ttl_seconds: Seconds an entry stays valid after it is stored
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        ttl_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries before the least recently used is evicted
+            ttl_seconds: Lifetime of each entry in seconds
+            clock: Monotonic time source, injectable for tests
+
+        Raises:
+            ValueError: If maxsize or ttl_seconds is not positive
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        if ttl_seconds <= 0:
+            raise ValueError(f"ttl_seconds must be positive, got {ttl_seconds}")
+
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including any not yet purged."""
+        return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        """Return a counter bumped by every `set`, `discard` and `clear`."""
+        return self._generation
+
+    def get(self, key: K) -> Optional[V]:
+        """Look up a live entry and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        with self._lock:
+            self._generation += 1
+            self._store(key, value)
+
+    def set_if_generation(self, key: K, value: V, generation: int) -> bool:
+        """Store a value loaded elsewhere, unless the cache was written since.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            generation: Value of `generation` captured before the value was loaded
+
+        Returns:
+            True if stored, False if a write or invalidation happened in between
+        """
+        with self._lock:
+            if generation != self._generation:
+                return False
+            self._store(key, value)
+            return True
+
+    def _store(self, key: K, value: V) -> None:
+        """Insert an entry and evict the oldest if full; caller holds the lock."""
+        self._entries[key] = (self._clock() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: K) -> None:
+        """Remove an entry if present.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
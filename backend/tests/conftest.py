@@ -0,0 +1,20 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from app.config import Settings
+
+
+@pytest.fixture(scope="session")
+def default_settings(tmp_path_factory: pytest.TempPathFactory) -> Settings:
+    """Build one Settings instance from defaults only, shared by read-only tests.
+
+    Environment variables for every settings field are removed and the working
+    directory has no .env file while the instance is built, so local
+    configuration cannot leak in. Both are restored before any test runs.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        for name in Settings.model_fields:
+            mp.delenv(name.upper(), raising=False)
+        mp.chdir(tmp_path_factory.mktemp("default_settings"))
+        return Settings()
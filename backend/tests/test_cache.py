@@ -0,0 +1,561 @@
+"""Unit tests for in-process caching adapters."""
+
+from collections.abc import Iterator, Sequence
+from dataclasses import FrozenInstanceError, replace
+from typing import Optional
+
+import pytest
+
+from app.domain.entities import Ingredient, Recipe, UserProfile
+from app.domain.interfaces import ILLMService, IRecipeRepository, IUserRepository
+from app.infrastructure.cache import (
+    CachedLLMService,
+    CachedRecipeRepository,
+    CachedUserRepository,
+    TTLCache,
+)
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class InMemoryRecipeRepository(IRecipeRepository):
+    """Dict-backed recipe repository that counts backend calls."""
+
+    def __init__(self) -> None:
+        self.recipes: dict[str, Recipe] = {}
+        self.calls: list[str] = []
+
+    def save(self, recipe: Recipe) -> None:
+        self.calls.append("save")
+        self.recipes[recipe.id] = recipe
+
+    def save_many(self, recipes: Sequence[Recipe]) -> None:
+        self.calls.append("save_many")
+        self.recipes.update((recipe.id, recipe) for recipe in recipes)
+
+    def get_by_id(self, recipe_id: str) -> Optional[Recipe]:
+        self.calls.append("get_by_id")
+        return self.recipes.get(recipe_id)
+
+    def get_by_ids(self, recipe_ids: Sequence[str]) -> list[Recipe]:
+        self.calls.append("get_by_ids")
+        return [self.recipes[rid] for rid in set(recipe_ids) if rid in self.recipes]
+
+    def get_all(self) -> list[Recipe]:
+        self.calls.append("get_all")
+        return list(self.recipes.values())
+
+    def iter_all(self) -> Iterator[Recipe]:
+        self.calls.append("iter_all")
+        yield from list(self.recipes.values())
+
+    def delete(self, recipe_id: str) -> bool:
+        self.calls.append("delete")
+        return self.recipes.pop(recipe_id, None) is not None
+
+    def exists(self, recipe_id: str) -> bool:
+        self.calls.append("exists")
+        return recipe_id in self.recipes
+
+    def exists_many(self, recipe_ids: Sequence[str]) -> set[str]:
+        self.calls.append("exists_many")
+        return {rid for rid in recipe_ids if rid in self.recipes}
+
+
+class InMemoryUserRepository(IUserRepository):
+    """Dict-backed user repository that counts backend calls."""
+
+    def __init__(self) -> None:
+        self.users: dict[str, UserProfile] = {}
+        self.calls: list[str] = []
+
+    def save(self, user: UserProfile) -> None:
+        self.calls.append("save")
+        self.users[user.id] = user
+
+    def get_by_id(self, user_id: str) -> Optional[UserProfile]:
+        self.calls.append("get_by_id")
+        return self.users.get(user_id)
+
+    def get_by_ids(self, user_ids: Sequence[str]) -> list[UserProfile]:
+        self.calls.append("get_by_ids")
+        return [self.users[uid] for uid in set(user_ids) if uid in self.users]
+
+    def delete(self, user_id: str) -> bool:
+        self.calls.append("delete")
+        return self.users.pop(user_id, None) is not None
+
+    def exists(self, user_id: str) -> bool:
+        self.calls.append("exists")
+        return user_id in self.users
+
+    def exists_many(self, user_ids: Sequence[str]) -> set[str]:
+        self.calls.append("exists_many")
+        return {uid for uid in user_ids if uid in self.users}
+
+
+class EchoLLMService(ILLMService):
+    """LLM stand-in that echoes prompts and records every backend call."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, ...]] = []
+
+    def generate(self, prompt: str, temperature: float = 0.7, max_tokens: int = 2000) -> str:
+        self.calls.append(("generate", prompt))
+        return f"re: {prompt}"
+
+    def generate_with_system_prompt(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+    ) -> str:
+        self.calls.append(("generate_with_system_prompt", system_prompt, user_prompt))
+        return f"{system_prompt} re: {user_prompt}"
+
+    def generate_batch(
+        self,
+        prompts: Sequence[str],
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+    ) -> list[str]:
+        self.calls.append(("generate_batch", *prompts))
+        return [f"re: {prompt}" for prompt in prompts]
+
+    def is_available(self) -> bool:
+        return True
+
+
+def make_recipe(recipe_id: str) -> Recipe:
+    """Build a minimal recipe."""
+    return Recipe(
+        id=recipe_id,
+        title=f"Recipe {recipe_id}",
+        description="Test recipe",
+        servings=2,
+        prep_time_minutes=5,
+        cook_time_minutes=10,
+        ingredients=[Ingredient(name="salt", quantity=1.0, unit="tsp")],
+        instructions=["Cook"],
+    )
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_get_and_set(self) -> None:
+        """Test storing and retrieving a value."""
+        cache: TTLCache[str, int] = TTLCache()
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+
+    def test_entry_expires(self) -> None:
+        """Test that entries expire after the TTL."""
+        clock = FakeClock()
+        cache: TTLCache[str, int] = TTLCache(ttl_seconds=10, clock=clock)
+        cache.set("a", 1)
+        clock.now = 9.9
+        assert cache.get("a") == 1
+        clock.now = 10.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test that the least recently used entry is evicted when full."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_discard_and_clear(self) -> None:
+        """Test removing entries."""
+        cache: TTLCache[str, int] = TTLCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.discard("a")
+        cache.discard("missing")
+        assert cache.get("a") is None
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_set_if_generation(self) -> None:
+        """Test that loaded values are dropped after any intervening write."""
+        cache: TTLCache[str, int] = TTLCache()
+        generation = cache.generation
+        assert cache.set_if_generation("a", 1, generation)
+        assert cache.set_if_generation("b", 2, generation)
+
+        cache.discard("a")
+        assert not cache.set_if_generation("a", 1, generation)
+        assert cache.get("a") is None
+
+        generation = cache.generation
+        cache.set("c", 3)
+        assert not cache.set_if_generation("d", 4, generation)
+        generation = cache.generation
+        cache.clear()
+        assert not cache.set_if_generation("d", 4, generation)
+        assert len(cache) == 0
+
+    @pytest.mark.parametrize(("maxsize", "ttl_seconds"), [(0, 60.0), (10, 0.0)])
+    def test_invalid_arguments(self, maxsize: int, ttl_seconds: float) -> None:
+        """Test that non-positive limits are rejected."""
+        with pytest.raises(ValueError):
+            TTLCache(maxsize=maxsize, ttl_seconds=ttl_seconds)
+
+
+class TestCachedRecipeRepository:
+    """Tests for CachedRecipeRepository."""
+
+    @pytest.fixture
+    def inner(self) -> InMemoryRecipeRepository:
+        """Create a backing repository with two recipes."""
+        repo = InMemoryRecipeRepository()
+        repo.recipes = {"r1": make_recipe("r1"), "r2": make_recipe("r2")}
+        return repo
+
+    def test_get_by_id_cached_after_first_lookup(self, inner: InMemoryRecipeRepository) -> None:
+        """Test that repeated lookups hit the backing repository once."""
+        repo = CachedRecipeRepository(inner)
+        first = repo.get_by_id("r1")
+        second = repo.get_by_id("r1")
+        assert first is second
+        assert inner.calls == ["get_by_id"]
+        assert (repo.hits, repo.misses) == (1, 1)
+
+    def test_missing_recipe_not_cached(self, inner: InMemoryRecipeRepository) -> None:
+        """Test that misses are always delegated."""
+        repo = CachedRecipeRepository(inner)
+        assert repo.get_by_id("nope") is None
+        assert repo.get_by_id("nope") is None
+        assert inner.calls == ["get_by_id", "get_by_id"]
+
+    def test_save_populates_cache(self, inner: InMemoryRecipeRepository) -> None:
+        """Test that saved recipes are served from the cache."""
+        repo = CachedRecipeRepository(inner)
+        recipe = make_recipe("r3")
+        repo.save(recipe)
+        assert repo.get_by_id("r3") is recipe
+        assert inner.calls == ["save"]
+
+    def test_save_many_populates_cache(self, inner: InMemoryRecipeRepository) -> None:
+        """Test that bulk-saved recipes are written once and served from the cache."""
+        repo = CachedRecipeRepository(inner)
+        repo.save_many([make_recipe("r3"), make_recipe("r4")])
+        assert {recipe.id for recipe in repo.get_by_ids(["r3", "r4"])} == {"r3", "r4"}
+        assert inner.calls == ["save_many"]
+
+    def test_delete_invalidates_cache(self, inner: InMemoryRecipeRepository) -> None:
+        """Test that deleted recipes are no longer served."""
+        repo = CachedRecipeRepository(inner)
+        repo.get_by_id("r1")
+        assert repo.delete("r1")
+        assert repo.get_by_id("r1") is None
+
+    def test_lookup_during_delete_not_cached(self, inner: InMemoryRecipeRepository) -> None:
+        """Test that a lookup made while the backend delete runs is not cached."""
+        repo = CachedRecipeRepository(inner)
+        backend_delete = inner.delete
+
+        def delete_with_racing_lookup(recipe_id: str) -> bool:
+            repo.get_by_id(recipe_id)  # another thread reads before the row is gone
+            return backend_delete(recipe_id)
+
+        inner.delete = delete_with_racing_lookup  # type: ignore[method-assign]
+        assert repo.delete("r1")
+        assert not repo.exists("r1")
+
+    def test_lookup_straddling_delete_not_cached(self, inner: InMemoryRecipeRepository) -> None:
+        """Test that a value read before a delete is not cached after the eviction."""
+        repo = CachedRecipeRepository(inner)
+        backend_get = inner.get_by_id
+
+        def get_then_concurrent_delete(recipe_id: str) -> Optional[Recipe]:
+            recipe = backend_get(recipe_id)
+            inner.get_by_id = backend_get  # type: ignore[method-assign]
+            repo.delete(recipe_id)  # another thread deletes before the cache write
+            return recipe
+
+        inner.get_by_id = get_then_concurrent_delete  # type: ignore[method-assign]
+        assert repo.get_by_id("r1") is not None
+        assert not repo.exists("r1")
+
+    def test_get_all_straddling_save_not_cached(self, inner: InMemoryRecipeRepository) -> None:
+        """Test that a listing read before a save is not cached after it."""
+        repo = CachedRecipeRepository(inner)
+        backend_get_all = inner.get_all
+
+        def get_all_then_concurrent_save() -> list[Recipe]:
+            recipes = backend_get_all()
+            inner.get_all = backend_get_all  # type: ignore[method-assign]
+            repo.save(make_recipe("r3"))
+            return recipes
+
+        inner.get_all = get_all_then_concurrent_save  # type: ignore[method-assign]
+        assert len(repo.get_all()) == 2
+        assert len(repo.get_all()) == 3
+
+    def test_failed_save_many_clears_get_all(self, inner: InMemoryRecipeRepository) -> None:
+        """Test that a partially applied bulk write still invalidates get_all."""
+        repo = CachedRecipeRepository(inner)
+        repo.get_all()
+
+        def partial_save_many(recipes: Sequence[Recipe]) -> None:
+            inner.recipes[recipes[0].id] = recipes[0]
+            raise RuntimeError("bulk write interrupted")
+
+        inner.save_many = partial_save_many  # type: ignore[method-assign]
+        with pytest.raises(RuntimeError):
+            repo.save_many([make_recipe("r3"), make_recipe("r4")])
+        assert len(repo.get_all()) == 3
+
+    def test_failed_save_many_evicts_cached_recipes(self, inner: InMemoryRecipeRepository) -> None:
+        """Test that a partially applied bulk write stops serving old cached copies."""
+        repo = CachedRecipeRepository(inner)
+        repo.get_by_id("r1")
+        updated = replace(make_recipe("r1"), title="Updated")
+
+        def partial_save_many(recipes: Sequence[Recipe]) -> None:
+            inner.recipes[recipes[0].id] = recipes[0]
+            raise RuntimeError("bulk write interrupted")
+
+        inner.save_many = partial_save_many  # type: ignore[method-assign]
+        with pytest.raises(RuntimeError):
+            repo.save_many([updated, make_recipe("r9")])
+        cached = repo.get_by_id("r1")
+        assert cached is not None and cached.title == "Updated"
+
+    def test_get_by_ids_fetches_only_misses(self, inner: InMemoryRecipeRepository) -> None:
+        """Test that batch lookups only ask the backend for uncached IDs."""
+        repo = CachedRecipeRepository(inner)
+        repo.get_by_id("r1")
+        inner.calls.clear()
+
+        recipes = repo.get_by_ids(["r1", "r2", "r2", "nope"])
+        assert {recipe.id for recipe in recipes} == {"r1", "r2"}
+        assert inner.calls == ["get_by_ids"]
+
+        inner.calls.clear()
+        repo.get_by_ids(["r1", "r2"])
+        assert inner.calls == []
+
+    def test_exists_warms_cache_for_get_by_id(self, inner: InMemoryRecipeRepository) -> None:
+        """Test that exists followed by get_by_id costs one backend lookup."""
+        repo = CachedRecipeRepository(inner)
+        assert repo.exists("r1")
+        assert repo.get_by_id("r1") is not None
+        assert not repo.exists("nope")
+        assert inner.calls == ["get_by_id", "get_by_id"]
+
+    def test_exists_many_checks_only_uncached_ids(self, inner: InMemoryRecipeRepository) -> None:
+        """Test that cached recipes are reported present without a backend call."""
+        repo = CachedRecipeRepository(inner)
+        assert repo.exists_many(["r1", "nope"]) == {"r1"}
+        assert inner.calls == ["exists_many"]
+
+        repo.get_by_ids(["r1", "r2"])
+        inner.calls.clear()
+        assert repo.exists_many(["r1", "r2"]) == {"r1", "r2"}
+        assert inner.calls == []
+
+    def test_get_all_warms_cache(self, inner: InMemoryRecipeRepository) -> None:
+        """Test that listing all recipes caches them for point lookups."""
+        repo = CachedRecipeRepository(inner)
+        assert len(repo.get_all()) == 2
+        repo.get_by_id("r2")
+        assert inner.calls == ["get_all"]
+
+    def test_get_all_result_cached_until_write(self, inner: InMemoryRecipeRepository) -> None:
+        """Test that get_all is reused until a write goes through the cache."""
+        repo = CachedRecipeRepository(inner)
+        repo.get_all()
+        recipes = repo.get_all()
+        assert len(recipes) == 2
+        assert inner.calls == ["get_all"]
+
+        repo.save(make_recipe("r3"))
+        assert len(repo.get_all()) == 3
+        assert inner.calls == ["get_all", "save", "get_all"]
+
+    def test_iter_all_streams_and_warms_cache(self, inner: InMemoryRecipeRepository) -> None:
+        """Test that streaming all recipes caches them for point lookups."""
+        repo = CachedRecipeRepository(inner)
+        stream = repo.iter_all()
+        assert next(stream).id == "r1"
+        assert repo.get_by_id("r1") is not None
+        assert [recipe.id for recipe in stream] == ["r2"]
+        assert inner.calls == ["iter_all"]
+
+
+class TestCachedUserRepository:
+    """Tests for CachedUserRepository."""
+
+    @pytest.fixture
+    def inner(self) -> InMemoryUserRepository:
+        """Create a backing repository with one user."""
+        repo = InMemoryUserRepository()
+        repo.users = {"u1": UserProfile(id="u1", name="Test User")}
+        return repo
+
+    def test_get_by_id_cached_after_first_lookup(self, inner: InMemoryUserRepository) -> None:
+        """Test that repeated lookups hit the backing repository once."""
+        repo = CachedUserRepository(inner)
+        user = repo.get_by_id("u1")
+        assert user is not None
+        assert repo.get_by_id("u1") is user
+        assert repo.exists("u1")
+        assert inner.calls == ["get_by_id"]
+        assert (repo.hits, repo.misses) == (2, 1)
+
+    def test_get_by_ids_fetches_only_misses(self, inner: InMemoryUserRepository) -> None:
+        """Test that batch lookups only ask the backend for uncached IDs."""
+        inner.users["u2"] = UserProfile(id="u2", name="Second User")
+        repo = CachedUserRepository(inner)
+        repo.get_by_id("u1")
+        inner.calls.clear()
+
+        users = repo.get_by_ids(["u1", "u2", "nope"])
+        assert {user.id for user in users} == {"u1", "u2"}
+        assert inner.calls == ["get_by_ids"]
+
+    def test_save_invalidates_cache(self, inner: InMemoryUserRepository) -> None:
+        """Test that saving reloads the profile on the next lookup."""
+        repo = CachedUserRepository(inner)
+        repo.get_by_id("u1")
+        repo.save(UserProfile(id="u1", name="Renamed"))
+        user = repo.get_by_id("u1")
+        assert user is not None and user.name == "Renamed"
+        assert inner.calls == ["get_by_id", "save", "get_by_id"]
+
+    def test_unsaved_edit_not_visible_to_other_callers(self, inner: InMemoryUserRepository) -> None:
+        """Test that a shared cached profile cannot be edited in place."""
+        repo = CachedUserRepository(inner)
+        user = repo.get_by_id("u1")
+        assert user is not None
+        with pytest.raises(FrozenInstanceError):
+            user.name = "Edited"  # type: ignore[misc]
+
+        edited = replace(user, name="Edited")
+        assert edited.name == "Edited"
+        cached = repo.get_by_id("u1")
+        assert cached is not None and cached.name == "Test User"
+
+    def test_lookup_straddling_delete_not_cached(self, inner: InMemoryUserRepository) -> None:
+        """Test that a profile read before a delete is not cached after the eviction."""
+        repo = CachedUserRepository(inner)
+        backend_get = inner.get_by_id
+
+        def get_then_concurrent_delete(user_id: str) -> Optional[UserProfile]:
+            user = backend_get(user_id)
+            inner.get_by_id = backend_get  # type: ignore[method-assign]
+            repo.delete(user_id)  # another thread deletes before the cache write
+            return user
+
+        inner.get_by_id = get_then_concurrent_delete  # type: ignore[method-assign]
+        assert repo.get_by_id("u1") is not None
+        assert not repo.exists("u1")
+
+    def test_batch_lookup_straddling_save_not_cached(self, inner: InMemoryUserRepository) -> None:
+        """Test that profiles read before a save are not cached after it."""
+        repo = CachedUserRepository(inner)
+        backend_get_by_ids = inner.get_by_ids
+
+        def get_then_concurrent_save(user_ids: Sequence[str]) -> list[UserProfile]:
+            users = backend_get_by_ids(user_ids)
+            inner.get_by_ids = backend_get_by_ids  # type: ignore[method-assign]
+            repo.save(UserProfile(id="u1", name="Renamed"))
+            return users
+
+        inner.get_by_ids = get_then_concurrent_save  # type: ignore[method-assign]
+        assert [user.name for user in repo.get_by_ids(["u1"])] == ["Test User"]
+        user = repo.get_by_id("u1")
+        assert user is not None and user.name == "Renamed"
+
+    def test_delete_invalidates_cache(self, inner: InMemoryUserRepository) -> None:
+        """Test that deleted profiles are no longer served."""
+        repo = CachedUserRepository(inner)
+        repo.get_by_id("u1")
+        assert repo.delete("u1")
+        assert not repo.exists("u1")
+
+    def test_exists_many_checks_only_uncached_ids(self, inner: InMemoryUserRepository) -> None:
+        """Test that cached users are reported present without a backend call."""
+        repo = CachedUserRepository(inner)
+        repo.get_by_id("u1")
+        inner.calls.clear()
+        assert repo.exists_many(["u1", "u2"]) == {"u1"}
+        assert inner.calls == ["exists_many"]
+
+
+class TestCachedLLMService:
+    """Tests for CachedLLMService."""
+
+    def test_low_temperature_generation_cached(self) -> None:
+        """Test that identical low-temperature prompts reach the backend once."""
+        inner = EchoLLMService()
+        llm = CachedLLMService(inner)
+        assert llm.generate("soup?", temperature=0.0) == "re: soup?"
+        assert llm.generate("soup?", temperature=0.0) == "re: soup?"
+        assert inner.calls == [("generate", "soup?")]
+        assert (llm.hits, llm.misses) == (1, 1)
+
+    def test_high_temperature_generation_not_cached(self) -> None:
+        """Test that creative generations always reach the backend."""
+        inner = EchoLLMService()
+        llm = CachedLLMService(inner)
+        llm.generate("soup?")
+        llm.generate("soup?")
+        assert len(inner.calls) == 2
+        assert (llm.hits, llm.misses) == (0, 0)
+
+    def test_cache_key_includes_settings(self) -> None:
+        """Test that different temperatures and token limits are cached separately."""
+        inner = EchoLLMService()
+        llm = CachedLLMService(inner)
+        llm.generate("soup?", temperature=0.0)
+        llm.generate("soup?", temperature=0.1)
+        llm.generate("soup?", temperature=0.0, max_tokens=10)
+        assert len(inner.calls) == 3
+
+    def test_system_prompt_generation_cached(self) -> None:
+        """Test caching of system-prompted generations."""
+        inner = EchoLLMService()
+        llm = CachedLLMService(inner)
+        llm.generate_with_system_prompt("chef", "soup?", temperature=0.0)
+        llm.generate_with_system_prompt("chef", "soup?", temperature=0.0)
+        llm.generate_with_system_prompt("baker", "soup?", temperature=0.0)
+        assert len(inner.calls) == 2
+
+    def test_generate_batch_sends_only_misses(self) -> None:
+        """Test that batch generation reuses cached answers and keeps order."""
+        inner = EchoLLMService()
+        llm = CachedLLMService(inner)
+        llm.generate("b", temperature=0.0)
+        inner.calls.clear()
+
+        responses = llm.generate_batch(["a", "b", "c", "a"], temperature=0.0)
+        assert responses == ["re: a", "re: b", "re: c", "re: a"]
+        assert inner.calls == [("generate_batch", "a", "c")]
+        assert (llm.hits, llm.misses) == (1, 3)  # includes the warm-up miss for "b"
+
+    def test_generate_batch_counts_duplicate_prompt_once(self) -> None:
+        """Test that a prompt repeated in one batch is one miss and one generation."""
+        inner = EchoLLMService()
+        llm = CachedLLMService(inner)
+        assert llm.generate_batch(["a", "a"], temperature=0.0) == ["re: a", "re: a"]
+        assert inner.calls == [("generate_batch", "a")]
+        assert (llm.hits, llm.misses) == (0, 1)
@@ -3,6 +3,7 @@
 These tests verify entity behavior with zero external dependencies.
 """
 
+from dataclasses import FrozenInstanceError, fields, replace
 from datetime import date
 
 import pytest
@@ -49,31 +50,48 @@ class TestIngredient:
         scaled = ing.scale(0.5)
         assert scaled.quantity == 2.0
 
+    def test_ingredient_uses_slots(self) -> None:
+        """Test ingredients carry no per-instance __dict__."""
+        ing = Ingredient(name="salt", quantity=1.0, unit="tsp")
+        assert not hasattr(ing, "__dict__")
+
+    def test_ingredient_strings_interned(self) -> None:
+        """Test equal names and units share one string object."""
+        first = Ingredient(name="".join(["gar", "lic"]), quantity=1.0, unit="".join(["clo", "ves"]))
+        second = Ingredient(name="garlic", quantity=2.0, unit="cloves", notes="minced")
+        assert first.name is second.name
+        assert first.unit is second.unit
+
+        scaled = second.scale(2.0)
+        assert scaled.name is second.name
+        assert scaled.notes == "minced"
+
+
+@pytest.fixture(scope="module")
+def sample_recipe() -> Recipe:
+    """Create a sample recipe shared across the module; Recipe is frozen."""
+    return Recipe(
+        id="recipe-1",
+        title="Simple Pasta",
+        description="Easy pasta dish",
+        servings=4,
+        prep_time_minutes=10,
+        cook_time_minutes=15,
+        ingredients=[
+            Ingredient(name="pasta", quantity=1.0, unit="lb"),
+            Ingredient(name="olive oil", quantity=2.0, unit="tbsp"),
+            Ingredient(name="garlic", quantity=3.0, unit="cloves"),
+        ],
+        instructions=["Boil water", "Cook pasta", "Add oil and garlic"],
+        dietary_tags=["vegetarian"],
+        cuisine="italian",
+        protein_type="none",
+    )
+
 
 class TestRecipe:
     """Tests for Recipe entity."""
 
-    @pytest.fixture
-    def sample_recipe(self) -> Recipe:
-        """Create a sample recipe for testing."""
-        return Recipe(
-            id="recipe-1",
-            title="Simple Pasta",
-            description="Easy pasta dish",
-            servings=4,
-            prep_time_minutes=10,
-            cook_time_minutes=15,
-            ingredients=[
-                Ingredient(name="pasta", quantity=1.0, unit="lb"),
-                Ingredient(name="olive oil", quantity=2.0, unit="tbsp"),
-                Ingredient(name="garlic", quantity=3.0, unit="cloves"),
-            ],
-            instructions=["Boil water", "Cook pasta", "Add oil and garlic"],
-            dietary_tags=["vegetarian"],
-            cuisine="italian",
-            protein_type="none",
-        )
-
     def test_recipe_creation(self, sample_recipe: Recipe) -> None:
         """Test creating a recipe."""
         assert sample_recipe.id == "recipe-1"
@@ -104,13 +122,11 @@ class TestRecipe:
         scaled = sample_recipe.scale(4)
         assert scaled is sample_recipe
 
-    def test_recipe_scale_invalid_servings(self, sample_recipe: Recipe) -> None:
+    @pytest.mark.parametrize("servings", [0, -1])
+    def test_recipe_scale_invalid_servings(self, sample_recipe: Recipe, servings: int) -> None:
         """Test scaling recipe with invalid servings raises error."""
         with pytest.raises(ValueError, match="Servings must be at least 1"):
-            sample_recipe.scale(0)
-
-        with pytest.raises(ValueError, match="Servings must be at least 1"):
-            sample_recipe.scale(-1)
+            sample_recipe.scale(servings)
 
     def test_meets_dietary_requirements_success(self, sample_recipe: Recipe) -> None:
         """Test recipe meets dietary requirements."""
@@ -125,6 +141,12 @@ class TestRecipe:
         """Test recipe does not meet dietary requirements."""
         assert not sample_recipe.meets_dietary_requirements(["vegan", "gluten_free"])
 
+    def test_meets_dietary_requirements_any_iterable(self, sample_recipe: Recipe) -> None:
+        """Test requirements can be passed as any iterable of tags."""
+        assert sample_recipe.meets_dietary_requirements(frozenset({"vegetarian"}))
+        assert sample_recipe.meets_dietary_requirements(())
+        assert not sample_recipe.meets_dietary_requirements(tag for tag in ["Vegetarian", "vegan"])
+
     def test_has_ingredient_found(self, sample_recipe: Recipe) -> None:
         """Test finding an ingredient in recipe."""
         assert sample_recipe.has_ingredient("pasta")
@@ -135,29 +157,65 @@ class TestRecipe:
         assert sample_recipe.has_ingredient("PASTA")
         assert sample_recipe.has_ingredient("Olive Oil")
 
+    def test_has_ingredient_partial_match(self, sample_recipe: Recipe) -> None:
+        """Test ingredient search matches words and substrings of names."""
+        assert sample_recipe.has_ingredient("oil")
+        assert sample_recipe.has_ingredient("garl")
+
     def test_has_ingredient_not_found(self, sample_recipe: Recipe) -> None:
         """Test not finding an ingredient in recipe."""
         assert not sample_recipe.has_ingredient("chicken")
 
+    def test_recipe_is_frozen(self, sample_recipe: Recipe) -> None:
+        """Test recipes are immutable and hashable."""
+        with pytest.raises(FrozenInstanceError):
+            sample_recipe.servings = 8  # type: ignore[misc]
+        assert isinstance(sample_recipe.ingredients, tuple)
+        assert isinstance(sample_recipe.instructions, tuple)
+        assert isinstance(sample_recipe.dietary_tags, tuple)
+
+        twin = Recipe(
+            id="recipe-1",
+            title="Simple Pasta",
+            description="Easy pasta dish",
+            servings=4,
+            prep_time_minutes=10,
+            cook_time_minutes=15,
+            ingredients=[
+                Ingredient(name="pasta", quantity=1.0, unit="lb"),
+                Ingredient(name="olive oil", quantity=2.0, unit="tbsp"),
+                Ingredient(name="garlic", quantity=3.0, unit="cloves"),
+            ],
+            instructions=["Boil water", "Cook pasta", "Add oil and garlic"],
+            dietary_tags=["vegetarian"],
+            cuisine="italian",
+            protein_type="none",
+        )
+        assert twin is not sample_recipe
+        assert twin == sample_recipe
+        assert hash(twin) == hash(sample_recipe)
+        assert len({twin, sample_recipe}) == 1
+
+
+@pytest.fixture(scope="module")
+def sample_profile() -> UserProfile:
+    """Create a sample user profile shared across the module; tests only read it."""
+    return UserProfile(
+        id="user-1",
+        name="Test User",
+        household_size=2,
+        dietary_restrictions=["vegetarian", "gluten_free"],
+        disliked_ingredients=["mushrooms", "olives"],
+        cuisine_preferences=["italian", "mexican"],
+        max_prep_time_minutes=30,
+        max_cook_time_minutes=45,
+        avoid_protein_types=["beef"],
+    )
+
 
 class TestUserProfile:
     """Tests for UserProfile entity."""
 
-    @pytest.fixture
-    def sample_profile(self) -> UserProfile:
-        """Create a sample user profile."""
-        return UserProfile(
-            id="user-1",
-            name="Test User",
-            household_size=2,
-            dietary_restrictions=["vegetarian", "gluten_free"],
-            disliked_ingredients=["mushrooms", "olives"],
-            cuisine_preferences=["italian", "mexican"],
-            max_prep_time_minutes=30,
-            max_cook_time_minutes=45,
-            avoid_protein_types=["beef"],
-        )
-
     def test_profile_creation(self, sample_profile: UserProfile) -> None:
         """Test creating a user profile."""
         assert sample_profile.id == "user-1"
@@ -191,6 +249,42 @@ class TestUserProfile:
         assert sample_profile.avoids_protein("BEEF")
         assert not sample_profile.avoids_protein("chicken")
 
+    def test_prefers_cuisine(self, sample_profile: UserProfile) -> None:
+        """Test checking for preferred cuisines."""
+        assert sample_profile.prefers_cuisine("italian")
+        assert sample_profile.prefers_cuisine("Mexican")
+        assert not sample_profile.prefers_cuisine("thai")
+
+    def test_preferences_stored_as_tuples(self, sample_profile: UserProfile) -> None:
+        """Test that preference lists are frozen into tuples."""
+        assert sample_profile.dietary_restrictions == ("vegetarian", "gluten_free")
+        assert sample_profile.avoid_protein_types == ("beef",)
+
+    def test_profile_edit_via_replace(self, sample_profile: UserProfile) -> None:
+        """Test profiles are frozen and edited copies rebuild their lookups."""
+        with pytest.raises(FrozenInstanceError):
+            sample_profile.dietary_restrictions = ["keto"]  # type: ignore[misc]
+
+        edited = replace(
+            sample_profile,
+            dietary_restrictions=["Keto"],
+            disliked_ingredients=["cilantro"],
+            cuisine_preferences=["thai"],
+            avoid_protein_types=["pork"],
+        )
+        assert edited.has_dietary_restriction("keto")
+        assert not edited.has_dietary_restriction("vegetarian")
+        assert edited.dislikes_ingredient("Cilantro")
+        assert not edited.dislikes_ingredient("mushrooms")
+        assert edited.prefers_cuisine("THAI")
+        assert not edited.prefers_cuisine("italian")
+        assert edited.avoids_protein("pork")
+        assert not edited.avoids_protein("beef")
+        assert edited.dietary_restrictions == ("Keto",)
+
+        # The original profile is untouched
+        assert sample_profile.has_dietary_restriction("vegetarian")
+
 
 class TestMealSlot:
     """Tests for MealSlot entity."""
@@ -202,10 +296,17 @@ class TestMealSlot:
         assert slot.servings == 4
         assert slot.notes == "Dinner"
 
-    def test_meal_slot_invalid_servings(self) -> None:
+    @pytest.mark.parametrize("servings", [0, -1])
+    def test_meal_slot_invalid_servings(self, servings: int) -> None:
         """Test meal slot with invalid servings raises error."""
         with pytest.raises(ValueError, match="Servings must be at least 1"):
-            MealSlot(date=date(2024, 1, 15), recipe_id="recipe-1", servings=0)
+            MealSlot(date=date(2024, 1, 15), recipe_id="recipe-1", servings=servings)
+
+    def test_meal_slot_is_frozen(self) -> None:
+        """Test meal slots are immutable."""
+        slot = MealSlot(date=date(2024, 1, 15), recipe_id="recipe-1", servings=4)
+        with pytest.raises(FrozenInstanceError):
+            slot.servings = 2  # type: ignore[misc]
 
 
 class TestMealPlan:
@@ -231,6 +332,20 @@ class TestMealPlan:
         assert plan.is_active
         assert len(plan.meals) == 0
 
+    def test_meal_plan_copies_initial_meals(self) -> None:
+        """Test later changes to the caller's list do not desync the date index."""
+        meals = [MealSlot(date=date(2024, 1, 15), recipe_id="recipe-1", servings=4)]
+        plan = MealPlan(
+            id="plan-1", user_id="user-1", week_start_date=date(2024, 1, 15), meals=meals
+        )
+        meals.append(MealSlot(date=date(2024, 1, 16), recipe_id="recipe-2", servings=4))
+
+        assert len(plan.meals) == 1
+        plan.add_meal(MealSlot(date=date(2024, 1, 16), recipe_id="recipe-3", servings=2))
+        meal = plan.get_meal_by_date(date(2024, 1, 16))
+        assert meal is not None and meal.recipe_id == "recipe-3"
+        assert plan.get_date_range() == (date(2024, 1, 15), date(2024, 1, 16))
+
     def test_add_meal(self, sample_meal_plan: MealPlan) -> None:
         """Test adding meals to plan."""
         assert len(sample_meal_plan.meals) == 3
@@ -241,6 +356,26 @@ class TestMealPlan:
         assert meal is not None
         assert meal.recipe_id == "recipe-2"
 
+    def test_add_meal_duplicate_date(self, sample_meal_plan: MealPlan) -> None:
+        """Test adding a second meal on the same date raises error."""
+        with pytest.raises(ValueError, match="already has a meal"):
+            sample_meal_plan.add_meal(
+                MealSlot(date=date(2024, 1, 15), recipe_id="recipe-3", servings=2)
+            )
+        assert len(sample_meal_plan.meals) == 3
+
+    def test_initial_meals_indexed(self) -> None:
+        """Test meals passed at construction are found by date."""
+        plan = MealPlan(
+            id="plan-2",
+            user_id="user-1",
+            week_start_date=date(2024, 1, 15),
+            meals=[MealSlot(date=date(2024, 1, 15), recipe_id="recipe-1", servings=2)],
+        )
+        meal = plan.get_meal_by_date(date(2024, 1, 15))
+        assert meal is not None
+        assert meal.recipe_id == "recipe-1"
+
     def test_get_meal_by_date_not_found(self, sample_meal_plan: MealPlan) -> None:
         """Test retrieving meal for date not in plan."""
         meal = sample_meal_plan.get_meal_by_date(date(2024, 1, 20))
@@ -253,6 +388,10 @@ class TestMealPlan:
         assert "recipe-1" in recipe_ids
         assert "recipe-2" in recipe_ids
 
+    def test_get_unique_recipe_ids(self, sample_meal_plan: MealPlan) -> None:
+        """Test getting unique recipe IDs as a frozenset."""
+        assert sample_meal_plan.get_unique_recipe_ids() == frozenset({"recipe-1", "recipe-2"})
+
     def test_swap_meal(self, sample_meal_plan: MealPlan) -> None:
         """Test swapping a meal in the plan."""
         success = sample_meal_plan.swap_meal(date(2024, 1, 16), "recipe-3", 6)
@@ -272,6 +411,7 @@ class TestMealPlan:
         success = sample_meal_plan.remove_meal(date(2024, 1, 16))
         assert success
         assert len(sample_meal_plan.meals) == 2
+        assert sample_meal_plan.get_meal_by_date(date(2024, 1, 16)) is None
 
     def test_remove_meal_not_found(self, sample_meal_plan: MealPlan) -> None:
         """Test removing meal that doesn't exist."""
@@ -284,6 +424,17 @@ class TestMealPlan:
         assert start == date(2024, 1, 15)
         assert end == date(2024, 1, 17)
 
+    def test_get_date_range_after_removing_boundary(self, sample_meal_plan: MealPlan) -> None:
+        """Test date range shrinks when the first or last meal is removed."""
+        sample_meal_plan.remove_meal(date(2024, 1, 17))
+        assert sample_meal_plan.get_date_range() == (date(2024, 1, 15), date(2024, 1, 16))
+
+        sample_meal_plan.remove_meal(date(2024, 1, 15))
+        assert sample_meal_plan.get_date_range() == (date(2024, 1, 16), date(2024, 1, 16))
+
+        sample_meal_plan.remove_meal(date(2024, 1, 16))
+        assert sample_meal_plan.get_date_range() == (date(2024, 1, 15), date(2024, 1, 15))
+
     def test_get_date_range_empty_plan(self) -> None:
         """Test date range for empty meal plan."""
         plan = MealPlan(id="plan-1", user_id="user-1", week_start_date=date(2024, 1, 15))
@@ -314,6 +465,19 @@ class TestGroceryItem:
         item.add_quantity(1.5)
         assert item.quantity == 3.5
 
+    def test_mutable_fields_assignable(self) -> None:
+        """Test quantity, notes and purchase state can change after creation."""
+        item = GroceryItem(name="Milk", quantity=1.0, unit="Gallon", category="Dairy")
+        item.quantity = 2.0
+        item.notes = "whole"
+        item.is_purchased = True
+        assert (item.quantity, item.notes, item.is_purchased) == (2.0, "whole", True)
+        assert (item._name_lower, item._unit_lower, item._category_lower) == (
+            "milk",
+            "gallon",
+            "dairy",
+        )
+
     def test_mark_purchased(self) -> None:
         """Test marking item as purchased."""
         item = GroceryItem(name="Milk", quantity=1.0, unit="gallon")
@@ -372,12 +536,51 @@ class TestGroceryList:
         assert sample_grocery_list.total_items == 1
         assert sample_grocery_list.items[0].quantity == 3.0
 
+    def test_consolidate_unit_case_insensitive(self, sample_grocery_list: GroceryList) -> None:
+        """Test units differing only in case are consolidated."""
+        sample_grocery_list.consolidate_item("milk", 1.0, "Cups", "recipe-1")
+        sample_grocery_list.consolidate_item("milk", 2.0, "cups", "recipe-2")
+        assert sample_grocery_list.total_items == 1
+        assert sample_grocery_list.items[0].quantity == 3.0
+        assert sample_grocery_list.items[0].unit == "Cups"
+
     def test_consolidate_different_units(self, sample_grocery_list: GroceryList) -> None:
         """Test items with different units are not consolidated."""
         sample_grocery_list.consolidate_item("sugar", 2.0, "cups", "recipe-1")
         sample_grocery_list.consolidate_item("sugar", 100.0, "grams", "recipe-2")
         assert sample_grocery_list.total_items == 2
 
+    def test_consolidate_into_added_item(self, sample_grocery_list: GroceryList) -> None:
+        """Test consolidation merges into items added via add_item."""
+        sample_grocery_list.add_item(GroceryItem(name="Rice", quantity=1.0, unit="cups"))
+        sample_grocery_list.consolidate_item("rice", 2.0, "cups", "recipe-1")
+        assert sample_grocery_list.total_items == 1
+        assert sample_grocery_list.items[0].quantity == 3.0
+
+    def test_consolidate_into_initial_items(self) -> None:
+        """Test consolidation merges into items passed at construction."""
+        grocery_list = GroceryList(
+            id="list-2",
+            meal_plan_id="plan-1",
+            items=[GroceryItem(name="Onion", quantity=1.0, unit="whole")],
+        )
+        grocery_list.consolidate_item("onion", 2.0, "whole", "recipe-1")
+        assert grocery_list.total_items == 1
+        assert grocery_list.items[0].quantity == 3.0
+        assert grocery_list.mark_item_purchased("ONION")
+
+    def test_grocery_list_copies_initial_items(self) -> None:
+        """Test later changes to the caller's list do not desync the indices."""
+        items = [GroceryItem(name="Onion", quantity=1.0, unit="whole")]
+        grocery_list = GroceryList(id="list-2", meal_plan_id="plan-1", items=items)
+        items.append(GroceryItem(name="Garlic", quantity=1.0, unit="head"))
+
+        assert grocery_list.total_items == 1
+        grocery_list.consolidate_item("garlic", 2.0, "head", "recipe-1")
+        assert grocery_list.total_items == 2
+        assert grocery_list.mark_item_purchased("GARLIC")
+        assert grocery_list.items[1].is_purchased
+
     def test_get_items_by_category(self, sample_grocery_list: GroceryList) -> None:
         """Test getting items by category."""
         sample_grocery_list.add_item(
@@ -391,7 +594,12 @@ class TestGroceryList:
         )
 
         produce = sample_grocery_list.get_items_by_category("produce")
-        assert len(produce) == 2
+        assert [item.name for item in produce] == ["Tomatoes", "Lettuce"]
+        assert len(sample_grocery_list.get_items_by_category("PRODUCE")) == 2
+        assert sample_grocery_list.get_items_by_category("frozen") == []
+
+        produce.clear()  # returned list is a copy
+        assert len(sample_grocery_list.get_items_by_category("produce")) == 2
 
     def test_get_all_categories(self, sample_grocery_list: GroceryList) -> None:
         """Test getting all categories."""
@@ -466,26 +674,19 @@ class TestFeedback:
         assert feedback.rating == 5
         assert feedback.would_make_again
 
-    def test_feedback_invalid_rating_too_high(self) -> None:
-        """Test feedback with rating too high raises error."""
-        with pytest.raises(ValueError, match="Rating must be between 1 and 5"):
-            Feedback(
-                id="feedback-1",
-                user_id="user-1",
-                recipe_id="recipe-1",
-                rating=6,
-                would_make_again=True,
-            )
+        with pytest.raises(FrozenInstanceError):
+            feedback.rating = 1  # type: ignore[misc]
 
-    def test_feedback_invalid_rating_too_low(self) -> None:
-        """Test feedback with rating too low raises error."""
+    @pytest.mark.parametrize("rating", [0, 6, -1, 100])
+    def test_feedback_invalid_rating(self, rating: int) -> None:
+        """Test feedback with rating outside 1-5 raises error."""
         with pytest.raises(ValueError, match="Rating must be between 1 and 5"):
             Feedback(
                 id="feedback-1",
                 user_id="user-1",
                 recipe_id="recipe-1",
-                rating=0,
-                would_make_again=False,
+                rating=rating,
+                would_make_again=True,
             )
 
     def test_is_positive(self) -> None:
@@ -537,3 +738,99 @@ class TestFeedback:
         feedback = Feedback(id="f1", user_id="u1", recipe_id="r1", rating=3, would_make_again=True)
         # (3-3)/2 * 1.2 = 0
         assert feedback.get_sentiment_score() == 0.0
+
+    def test_sentiment_score_would_not_make_again(self) -> None:
+        """Test sentiment score is damped when user would not make it again."""
+        feedback = Feedback(id="f1", user_id="u1", recipe_id="r1", rating=4, would_make_again=False)
+        # (4-3)/2 * 0.8 = 0.4
+        assert feedback.get_sentiment_score() == pytest.approx(0.4)
+
+    @pytest.mark.parametrize(
+        ("would_make_again", "expected"), [(None, 0.4), (0, 0.4), (2, 0.6), ("yes", 0.6)]
+    )
+    def test_sentiment_score_truthy_would_make_again(
+        self, would_make_again: object, expected: float
+    ) -> None:
+        """Test non-bool would_make_again values are treated by truthiness."""
+        feedback = Feedback(
+            id="f1",
+            user_id="u1",
+            recipe_id="r1",
+            rating=4,
+            would_make_again=would_make_again,  # type: ignore[arg-type]
+        )
+        assert feedback.get_sentiment_score() == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    ("entity", "public_fields"),
+    [
+        (Ingredient, ["name", "quantity", "unit", "notes"]),
+        (
+            Recipe,
+            [
+                "id",
+                "title",
+                "description",
+                "servings",
+                "prep_time_minutes",
+                "cook_time_minutes",
+                "ingredients",
+                "instructions",
+                "dietary_tags",
+                "cuisine",
+                "difficulty",
+                "protein_type",
+                "image_url",
+                "source_url",
+                "rating",
+                "total_time_minutes",
+            ],
+        ),
+        (
+            UserProfile,
+            [
+                "id",
+                "name",
+                "household_size",
+                "dietary_restrictions",
+                "disliked_ingredients",
+                "cuisine_preferences",
+                "max_prep_time_minutes",
+                "max_cook_time_minutes",
+                "skill_level",
+                "avoid_protein_types",
+            ],
+        ),
+        (MealSlot, ["date", "recipe_id", "servings", "notes"]),
+        (MealPlan, ["id", "user_id", "week_start_date", "meals", "created_at", "is_active"]),
+        (
+            GroceryItem,
+            ["name", "quantity", "unit", "category", "recipe_sources", "is_purchased", "notes"],
+        ),
+        (GroceryList, ["id", "meal_plan_id", "items", "created_at", "week_start_date"]),
+        (
+            Feedback,
+            [
+                "id",
+                "user_id",
+                "recipe_id",
+                "rating",
+                "would_make_again",
+                "meal_plan_id",
+                "notes",
+                "cooked_date",
+                "created_at",
+            ],
+        ),
+    ],
+)
+def test_entity_public_fields(entity: type[object], public_fields: list[str]) -> None:
+    """Test the serializable field set of each entity is pinned.
+
+    Underscore-prefixed fields are internal caches that `asdict` also emits;
+    they must never be constructor arguments.
+    """
+    entity_fields = fields(entity)  # type: ignore[arg-type]
+    assert [f.name for f in entity_fields if not f.name.startswith("_")] == public_fields
+    assert not any(f.init for f in entity_fields if f.name.startswith("_"))